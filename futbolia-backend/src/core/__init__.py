@@ -1,9 +1,10 @@
 # Core module - Configuration, Settings, and Utilities
 
-from src.core.config import get_i18n_string, settings
+from src.core.config import get_i18n_string, get_settings, settings
 from src.core.fuzzy_search import (
     auto_complete,
     fuzzy_search_teams,
+    fuzzy_search_teams_batch,
     get_team_info,
     suggest_corrections,
 )
@@ -19,6 +20,7 @@ from src.core.rate_limit import RateLimitMiddleware
 
 __all__ = [
     "settings",
+    "get_settings",
     "get_i18n_string",
     "get_logger",
     "log_info",
@@ -28,6 +30,7 @@ __all__ = [
     "log_api_call",
     "RateLimitMiddleware",
     "fuzzy_search_teams",
+    "fuzzy_search_teams_batch",
     "suggest_corrections",
     "auto_complete",
     "get_team_info",
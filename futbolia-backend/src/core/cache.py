@@ -4,8 +4,12 @@ Implements TTL-based caching for API responses and expensive operations
 """
 
 import asyncio
+import heapq
+import itertools
+import random
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from functools import wraps
 from typing import Any
 
@@ -13,18 +17,23 @@ from typing import Any
 class CacheEntry:
     """Represents a cached value with expiration time"""
 
+    __slots__ = ("value", "created_at", "ttl_seconds", "expires_at", "hits")
+
     def __init__(self, value: Any, ttl_seconds: int = 3600):
         self.value = value
-        self.created_at = time.time()
+        # Monotonic clock so wall-clock adjustments never expire (or revive) entries
+        self.created_at = time.monotonic()
         self.ttl_seconds = ttl_seconds
+        self.expires_at = self.created_at + ttl_seconds
+        self.hits = 0
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired"""
-        return time.time() - self.created_at > self.ttl_seconds
+        return time.monotonic() >= self.expires_at
 
     def get_age(self) -> float:
         """Get age of cache entry in seconds"""
-        return time.time() - self.created_at
+        return time.monotonic() - self.created_at
 
 
 class TTLCache:
@@ -33,46 +42,66 @@ class TTLCache:
 
     Features:
     - Automatic expiration based on TTL
-    - Size limits to prevent memory issues
+    - Size limits to prevent memory issues (value-aware LRU eviction)
     - Background cleanup of expired entries
     """
 
+    # Fraction of least recently used entries considered when evicting
+    EVICTION_SAMPLE_RATIO = 0.1
+
     def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
-        self._cache: dict[str, CacheEntry] = {}
+        # Ordered by recency: least recently used entries live at the front
+        self._cache: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        # Min-heap of (expiry_timestamp, seq, key); stale items are skipped lazily.
+        # The sequence number breaks ties so keys themselves are never compared.
+        self._expiry_heap: list[tuple[float, int, Hashable]] = []
+        self._heap_seq = itertools.count()
         self.max_size = max_size
         self.default_ttl = default_ttl
         self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> Any | None:
-        """Get value from cache if not expired"""
-        async with self._lock:
-            entry = self._cache.get(key)
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get value from cache if not expired
 
-            if entry is None:
-                return None
+        Synchronous and lock-free: nothing here awaits, so the lookup cannot
+        interleave with the lock-protected multi-step updates in set().
+        """
+        entry = self._cache.get(key)
 
-            if entry.is_expired():
-                del self._cache[key]
-                return None
+        if entry is None:
+            return None
+
+        if entry.is_expired():
+            self._cache.pop(key, None)
+            return None
 
-            return entry.value
+        entry.hits += 1
+        self._cache.move_to_end(key)
+        return entry.value
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    async def set(self, key: Hashable, value: Any, ttl: int | None = None) -> None:
         """Set value in cache with optional custom TTL"""
         async with self._lock:
-            # Remove oldest entries if at max size
-            if len(self._cache) >= self.max_size:
+            # Make room if at max size (overwriting an existing key needs no room)
+            if key not in self._cache and len(self._cache) >= self.max_size:
                 await self._cleanup_expired()
 
-                # If still at max, remove oldest
+                # If still at max, evict a cold entry
                 if len(self._cache) >= self.max_size:
-                    oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-                    del self._cache[oldest_key]
+                    self._evict_one()
 
             ttl_to_use = ttl if ttl is not None else self.default_ttl
-            self._cache[key] = CacheEntry(value, ttl_to_use)
+            entry = CacheEntry(value, ttl_to_use)
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, next(self._heap_seq), key))
 
-    async def delete(self, key: str) -> None:
+            # Overwrites and deletes leave stale heap items behind; compact occasionally
+            if len(self._expiry_heap) > 2 * self.max_size:
+                self._rebuild_expiry_heap()
+
+    async def delete(self, key: Hashable) -> None:
         """Delete a key from cache"""
         async with self._lock:
             self._cache.pop(key, None)
@@ -81,15 +110,42 @@ class TTLCache:
         """Clear all cache entries"""
         async with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
 
     async def _cleanup_expired(self) -> None:
-        """Remove all expired entries"""
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        """Remove all expired entries, popping only what is due from the expiry heap"""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # The key may have been deleted or overwritten with a later expiry
+            if entry is not None and entry.is_expired():
+                del self._cache[key]
+
+    def _evict_one(self) -> None:
+        """
+        Evict the least-hit entry among the least recently used ones (v-LRU)
+
+        Plain LRU would drop the oldest entry even if it is hot; looking at the
+        coldest 10% by recency and picking the one with fewest hits keeps
+        frequently reused entries (popular teams, standings) around longer.
+        """
+        sample_size = max(1, int(len(self._cache) * self.EVICTION_SAMPLE_RATIO))
+        candidates = itertools.islice(self._cache.items(), sample_size)
+        # min() keeps the first (least recent) candidate on ties
+        victim_key, _ = min(candidates, key=lambda item: item[1].hits)
+        del self._cache[victim_key]
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Drop stale heap items so the heap only tracks live entries"""
+        self._expiry_heap = [
+            (entry.expires_at, next(self._heap_seq), key) for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
 
     async def get_or_set(
-        self, key: str, fetch_func: Callable, ttl: int | None = None, *args, **kwargs
+        self, key: Hashable, fetch_func: Callable, ttl: int | None = None, *args, **kwargs
     ) -> Any:
         """
         Get value from cache or fetch and cache it
@@ -102,7 +158,7 @@ class TTLCache:
                 team_id=123
             )
         """
-        value = await self.get(key)
+        value = self.get(key)
         if value is not None:
             return value
 
@@ -117,30 +173,32 @@ class TTLCache:
 
         return value
 
-    async def get_stats(self) -> dict[str, Any]:
+    async def get_stats(self, detailed: bool = False, sample: int = 50) -> dict[str, Any]:
         """
         Get cache statistics
 
-        Returns comprehensive cache statistics including:
+        Returns cache statistics including:
         - Current size and max size
         - Default TTL
-        - Details for each cache entry (age, TTL, expiration time)
+        - If detailed, per-entry details (age, TTL, expiration time) for a
+          random sample of at most `sample` entries, so the cost stays bounded
         """
         async with self._lock:
             await self._cleanup_expired()
-            return {
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "default_ttl": self.default_ttl,
-                "entries": {
-                    key: {
-                        "age_seconds": entry.get_age(),
-                        "ttl_seconds": entry.ttl_seconds,
-                        "expires_in": entry.ttl_seconds - entry.get_age(),
-                    }
-                    for key, entry in self._cache.items()
-                },
+            items = list(self._cache.items()) if detailed else None
+
+        stats = self.get_stats_sync()
+        if items is not None:
+            # Computed outside the lock so concurrent set() calls are not blocked
+            stats["entries"] = {
+                key: {
+                    "age_seconds": entry.get_age(),
+                    "ttl_seconds": entry.ttl_seconds,
+                    "expires_in": entry.ttl_seconds - entry.get_age(),
+                }
+                for key, entry in random.sample(items, min(sample, len(items)))
             }
+        return stats
 
     def get_stats_sync(self) -> dict[str, Any]:
         """
@@ -174,18 +232,26 @@ def cached(ttl: int = 3600, key_prefix: str = ""):
     """
 
     def decorator(func: Callable):
+        # Resolved once at decoration time instead of on every call
+        is_coroutine = asyncio.iscoroutinefunction(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Generate cache key from function name and arguments
-            cache_key = f"{key_prefix}:{func.__name__}:{str(args)}:{str(kwargs)}"
+            # Tuple key: hashed in C, no repr formatting, kwargs order-independent
+            cache_key = (key_prefix, func.__qualname__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(cache_key)
+            except TypeError:
+                # Unhashable arguments (lists, dicts...) fall back to their repr
+                cache_key = repr(cache_key)
 
             # Try to get from cache
-            value = await api_cache.get(cache_key)
+            value = api_cache.get(cache_key)
             if value is not None:
                 return value
 
             # Call function and cache result
-            if asyncio.iscoroutinefunction(func):
+            if is_coroutine:
                 value = await func(*args, **kwargs)
             else:
                 value = func(*args, **kwargs)
@@ -3,159 +3,211 @@ FutbolIA - Fuzzy Search for Teams
 Suggests similar team names when exact match not found
 """
 
+import heapq
 import re
-from difflib import SequenceMatcher
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 # Common team name variations and aliases
-TEAM_ALIASES = {
-    # Spanish teams
-    "real madrid": ["real", "madrid", "rm", "rmcf", "merengues", "blancos"],
-    "barcelona": ["barca", "barça", "fcb", "blaugrana", "cules"],
-    "atletico madrid": ["atleti", "atm", "colchoneros", "atletico"],
-    # English teams
-    "manchester city": ["city", "mcfc", "citizens", "man city"],
-    "manchester united": ["united", "mufc", "red devils", "man utd", "man united"],
-    "liverpool": ["lfc", "reds", "pool"],
-    "chelsea": ["cfc", "blues"],
-    "arsenal": ["afc", "gunners", "ars"],
-    "tottenham": ["spurs", "thfc", "tottenham hotspur"],
-    # Italian teams
-    "juventus": ["juve", "vecchia signora", "bianconeri"],
-    "inter milan": ["inter", "internazionale", "nerazzurri"],
-    "ac milan": ["milan", "rossoneri", "diavolo"],
-    "napoli": ["partenopei"],
-    # German teams
-    "bayern munich": ["bayern", "fcb", "bavarians", "bayern munchen"],
-    "borussia dortmund": ["dortmund", "bvb"],
-    # French teams
-    "paris saint-germain": ["psg", "paris", "parisiens"],
-    # South American teams
-    "boca juniors": ["boca", "xeneizes"],
-    "river plate": ["river", "millonarios", "gallinas"],
-    "flamengo": ["mengao", "urubu"],
-    "palmeiras": ["verdao", "porco"],
-    "santos": ["peixe"],
-    "corinthians": ["timao", "corintians"],
-    "sao paulo": ["tricolor", "spfc"],
-    # Ecuadorian teams
-    "barcelona sc": ["barcelona guayaquil", "idolo", "bsc"],
-    "emelec": ["bombon", "azules", "electricos"],
-    "liga de quito": ["liga", "ldu", "albos", "universitarios"],
-    "deportivo quito": ["deportivo", "aucas"],
-    "el nacional": ["nacional", "criollos", "militares"],
-    "independiente del valle": ["idv", "independiente", "rayados"],
-    # Colombian teams
-    "atletico nacional": ["nacional medellin", "verdolaga"],
-    "millonarios": ["millos", "embajador"],
-    "america de cali": ["america", "diablos rojos"],
-    "deportivo cali": ["cali", "azucareros"],
-    "junior": ["junior barranquilla", "tiburones"],
-    # Argentine teams
-    "racing club": ["racing", "academia"],
-    "independiente": ["rojo", "diablos"],
-    "san lorenzo": ["ciclón", "cuervos"],
-    # National teams
-    "ecuador": ["tricolor", "la tri"],
-    "colombia": ["cafeteros", "los cafeteros"],
-    "argentina": ["albiceleste", "la scaloneta"],
-    "brazil": ["brasil", "canarinha", "seleção"],
-    "uruguay": ["celeste", "charrúas"],
-    "peru": ["blanquirroja", "incas"],
-    "chile": ["la roja"],
-    "mexico": ["el tri", "aztecas"],
-}
+TEAM_ALIASES = MappingProxyType(
+    {
+        # Spanish teams
+        "real madrid": ["real", "madrid", "rm", "rmcf", "merengues", "blancos"],
+        "barcelona": ["barca", "barça", "fcb", "blaugrana", "cules"],
+        "atletico madrid": ["atleti", "atm", "colchoneros", "atletico"],
+        # English teams
+        "manchester city": ["city", "mcfc", "citizens", "man city"],
+        "manchester united": ["united", "mufc", "red devils", "man utd", "man united"],
+        "liverpool": ["lfc", "reds", "pool"],
+        "chelsea": ["cfc", "blues"],
+        "arsenal": ["afc", "gunners", "ars"],
+        "tottenham": ["spurs", "thfc", "tottenham hotspur"],
+        # Italian teams
+        "juventus": ["juve", "vecchia signora", "bianconeri"],
+        "inter milan": ["inter", "internazionale", "nerazzurri"],
+        "ac milan": ["milan", "rossoneri", "diavolo"],
+        "napoli": ["partenopei"],
+        # German teams
+        "bayern munich": ["bayern", "fcb", "bavarians", "bayern munchen"],
+        "borussia dortmund": ["dortmund", "bvb"],
+        # French teams
+        "paris saint-germain": ["psg", "paris", "parisiens"],
+        # South American teams
+        "boca juniors": ["boca", "xeneizes"],
+        "river plate": ["river", "millonarios", "gallinas"],
+        "flamengo": ["mengao", "urubu"],
+        "palmeiras": ["verdao", "porco"],
+        "santos": ["peixe"],
+        "corinthians": ["timao", "corintians"],
+        "sao paulo": ["tricolor", "spfc"],
+        # Ecuadorian teams
+        "barcelona sc": ["barcelona guayaquil", "idolo", "bsc"],
+        "emelec": ["bombon", "azules", "electricos"],
+        "liga de quito": ["liga", "ldu", "albos", "universitarios"],
+        "deportivo quito": ["deportivo", "aucas"],
+        "el nacional": ["nacional", "criollos", "militares"],
+        "independiente del valle": ["idv", "independiente", "rayados"],
+        # Colombian teams
+        "atletico nacional": ["nacional medellin", "verdolaga"],
+        "millonarios": ["millos", "embajador"],
+        "america de cali": ["america", "diablos rojos"],
+        "deportivo cali": ["cali", "azucareros"],
+        "junior": ["junior barranquilla", "tiburones"],
+        # Argentine teams
+        "racing club": ["racing", "academia"],
+        "independiente": ["rojo", "diablos"],
+        "san lorenzo": ["ciclón", "cuervos"],
+        # National teams
+        "ecuador": ["tricolor", "la tri"],
+        "colombia": ["cafeteros", "los cafeteros"],
+        "argentina": ["albiceleste", "la scaloneta"],
+        "brazil": ["brasil", "canarinha", "seleção"],
+        "uruguay": ["celeste", "charrúas"],
+        "peru": ["blanquirroja", "incas"],
+        "chile": ["la roja"],
+        "mexico": ["el tri", "aztecas"],
+    }
+)
 
 # Country mapping for teams
-TEAM_COUNTRIES = {
-    # European
-    "real madrid": "España",
-    "barcelona": "España",
-    "atletico madrid": "España",
-    "manchester city": "Inglaterra",
-    "manchester united": "Inglaterra",
-    "liverpool": "Inglaterra",
-    "chelsea": "Inglaterra",
-    "arsenal": "Inglaterra",
-    "juventus": "Italia",
-    "inter milan": "Italia",
-    "ac milan": "Italia",
-    "napoli": "Italia",
-    "bayern munich": "Alemania",
-    "borussia dortmund": "Alemania",
-    "paris saint-germain": "Francia",
-    # South American
-    "boca juniors": "Argentina",
-    "river plate": "Argentina",
-    "racing club": "Argentina",
-    "flamengo": "Brasil",
-    "palmeiras": "Brasil",
-    "santos": "Brasil",
-    "barcelona sc": "Ecuador",
-    "emelec": "Ecuador",
-    "liga de quito": "Ecuador",
-    "atletico nacional": "Ecuador",
-    "millonarios": "Ecuador",  # Cambiado de Colombia a Ecuador
-    # National teams
-    "ecuador": "Ecuador",
-    "colombia": "Colombia",
-    "argentina": "Argentina",
-    "brazil": "Brasil",
-    "uruguay": "Uruguay",
-    "peru": "Perú",
-}
+TEAM_COUNTRIES = MappingProxyType(
+    {
+        # European
+        "real madrid": "España",
+        "barcelona": "España",
+        "atletico madrid": "España",
+        "manchester city": "Inglaterra",
+        "manchester united": "Inglaterra",
+        "liverpool": "Inglaterra",
+        "chelsea": "Inglaterra",
+        "arsenal": "Inglaterra",
+        "juventus": "Italia",
+        "inter milan": "Italia",
+        "ac milan": "Italia",
+        "napoli": "Italia",
+        "bayern munich": "Alemania",
+        "borussia dortmund": "Alemania",
+        "paris saint-germain": "Francia",
+        # South American
+        "boca juniors": "Argentina",
+        "river plate": "Argentina",
+        "racing club": "Argentina",
+        "flamengo": "Brasil",
+        "palmeiras": "Brasil",
+        "santos": "Brasil",
+        "barcelona sc": "Ecuador",
+        "emelec": "Ecuador",
+        "liga de quito": "Ecuador",
+        "atletico nacional": "Ecuador",
+        "millonarios": "Ecuador",  # Cambiado de Colombia a Ecuador
+        # National teams
+        "ecuador": "Ecuador",
+        "colombia": "Colombia",
+        "argentina": "Argentina",
+        "brazil": "Brasil",
+        "uruguay": "Uruguay",
+        "peru": "Perú",
+    }
+)
 
 # League mapping
-TEAM_LEAGUES = {
-    "real madrid": "La Liga",
-    "barcelona": "La Liga",
-    "atletico madrid": "La Liga",
-    "manchester city": "Premier League",
-    "liverpool": "Premier League",
-    "chelsea": "Premier League",
-    "arsenal": "Premier League",
-    "juventus": "Serie A",
-    "inter milan": "Serie A",
-    "ac milan": "Serie A",
-    "bayern munich": "Bundesliga",
-    "borussia dortmund": "Bundesliga",
-    "paris saint-germain": "Ligue 1",
-    "boca juniors": "Liga Argentina",
-    "river plate": "Liga Argentina",
-    "barcelona sc": "Liga Pro Ecuador",
-    "emelec": "Liga Pro Ecuador",
-    "atletico nacional": "Liga BetPlay",
-    "millonarios": "Liga BetPlay",
-}
+TEAM_LEAGUES = MappingProxyType(
+    {
+        "real madrid": "La Liga",
+        "barcelona": "La Liga",
+        "atletico madrid": "La Liga",
+        "manchester city": "Premier League",
+        "liverpool": "Premier League",
+        "chelsea": "Premier League",
+        "arsenal": "Premier League",
+        "juventus": "Serie A",
+        "inter milan": "Serie A",
+        "ac milan": "Serie A",
+        "bayern munich": "Bundesliga",
+        "borussia dortmund": "Bundesliga",
+        "paris saint-germain": "Ligue 1",
+        "boca juniors": "Liga Argentina",
+        "river plate": "Liga Argentina",
+        "barcelona sc": "Liga Pro Ecuador",
+        "emelec": "Liga Pro Ecuador",
+        "atletico nacional": "Liga BetPlay",
+        "millonarios": "Liga BetPlay",
+    }
+)
+
+# Patterns compiled once instead of going through re's internal cache per call
+_NON_WORD = re.compile(r"[^\w\s]")
+_WS = re.compile(r"\s+")
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize text for comparison"""
     # Convert to lowercase
     text = text.lower().strip()
     # Remove special characters except spaces
-    text = re.sub(r"[^\w\s]", "", text)
+    text = _NON_WORD.sub("", text)
     # Remove extra spaces
-    text = re.sub(r"\s+", " ", text)
+    text = _WS.sub(" ", text)
     return text
 
 
+# Aliases normalized once at import so search loops never re-run the regexes
+_ALIASES_NORM: dict[str, tuple[str, ...]] = {
+    team: tuple(normalize_text(alias) for alias in aliases)
+    for team, aliases in TEAM_ALIASES.items()
+}
+
+# Canonical teams in declaration order, plus a reverse map alias -> first team index
+_TEAM_NAMES_NORM: tuple[str, ...] = tuple(normalize_text(team) for team in TEAM_ALIASES)
+_TEAM_TITLES: tuple[str, ...] = tuple(team.title() for team in TEAM_ALIASES)
+_ALIAS_TEAM_TITLES: frozenset[str] = frozenset(_TEAM_TITLES)
+_ALIAS_TO_INDEX: dict[str, int] = {}
+for _index, _aliases in enumerate(_ALIASES_NORM.values()):
+    for _alias in _aliases:
+        _ALIAS_TO_INDEX.setdefault(_alias, _index)
+
+# All normalized aliases in one flat tuple, with each team's slice into it (for batch scoring)
+_ALIASES_FLAT: tuple[str, ...] = tuple(
+    alias for aliases in _ALIASES_NORM.values() for alias in aliases
+)
+_ALIAS_SPANS: dict[str, slice] = {}
+_offset = 0
+for _team, _aliases in _ALIASES_NORM.items():
+    _ALIAS_SPANS[_team] = slice(_offset, _offset + len(_aliases))
+    _offset += len(_aliases)
+
+
+def _similarity_normalized(
+    s1_normalized: str, s2_normalized: str, score_cutoff: float = 0.0
+) -> float:
+    """Similarity ratio (0-1) between two already-normalized strings, 0.0 below the cutoff"""
+    return fuzz.ratio(s1_normalized, s2_normalized, score_cutoff=score_cutoff) / 100.0
+
+
 def similarity_ratio(s1: str, s2: str) -> float:
-    """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, normalize_text(s1), normalize_text(s2)).ratio()
+    """Calculate similarity ratio (0-1) between two strings using RapidFuzz's C++ scorer"""
+    return _similarity_normalized(normalize_text(s1), normalize_text(s2))
 
 
+@lru_cache(maxsize=2048)
 def find_by_alias(query: str) -> str | None:
     """Find team name by alias"""
     query_normalized = normalize_text(query)
 
-    for team_name, aliases in TEAM_ALIASES.items():
-        # Check exact alias match
-        if query_normalized in [normalize_text(a) for a in aliases]:
-            return team_name.title()
+    # Exact alias match is a single dict probe
+    alias_index = _ALIAS_TO_INDEX.get(query_normalized, len(_TEAM_NAMES_NORM))
+
+    # A team declared earlier whose name contains the query still wins
+    for index in range(alias_index):
+        if query_normalized in _TEAM_NAMES_NORM[index]:
+            return _TEAM_TITLES[index]
 
-        # Check if query is part of team name
-        if query_normalized in normalize_text(team_name):
-            return team_name.title()
+    if alias_index < len(_TEAM_TITLES):
+        return _TEAM_TITLES[alias_index]
 
     return None
 
@@ -176,41 +228,172 @@ def fuzzy_search_teams(
         List of (team_name, similarity_score) tuples
     """
     query_normalized = normalize_text(query)
+    query_length = len(query_normalized)
+    # RapidFuzz bails out early on candidates that cannot reach this score (0-100 scale);
+    # the small slack keeps float rounding from dropping scores equal to the threshold
+    score_cutoff = max(threshold * 100.0 - 1e-6, 0.0)
     results = []
 
     # First check aliases
     alias_match = find_by_alias(query)
+    alias_match_normalized = None
     if alias_match:
         results.append((alias_match, 1.0))
+        alias_match_normalized = normalize_text(alias_match)
 
     # Then check all known teams
     for team in known_teams:
         team_normalized = normalize_text(team)
 
         # Skip if already found via alias
-        if alias_match and normalize_text(alias_match) == team_normalized:
+        if team_normalized == alias_match_normalized:
+            continue
+
+        # Exact match cannot be beaten, skip the scorers entirely
+        if team_normalized == query_normalized:
+            results.append((team, 1.0))
             continue
 
-        # Calculate similarity
-        score = similarity_ratio(query_normalized, team_normalized)
+        # Calculate similarity, skipping it when the length gap alone keeps
+        # the ratio (at most 2*min/(len1+len2)) below the threshold
+        team_length = len(team_normalized)
+        max_ratio = 2 * min(query_length, team_length) / ((query_length + team_length) or 1)
+        if max_ratio >= threshold - 1e-9:
+            score = _similarity_normalized(query_normalized, team_normalized, score_cutoff)
+        else:
+            score = 0.0
 
         # Also check if query is substring
         if query_normalized in team_normalized or team_normalized in query_normalized:
             score = max(score, 0.8)
 
-        # Check aliases for this team
-        if team_normalized in TEAM_ALIASES:
-            for alias in TEAM_ALIASES[team_normalized]:
-                alias_score = similarity_ratio(query_normalized, normalize_text(alias))
-                score = max(score, alias_score)
+        # Check aliases for this team (best alias scored in a single C call)
+        aliases_normalized = _ALIASES_NORM.get(team_normalized)
+        if aliases_normalized:
+            best_alias = process.extractOne(
+                query_normalized,
+                aliases_normalized,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+            )
+            if best_alias:
+                score = max(score, best_alias[1] / 100.0)
 
         if score >= threshold:
             results.append((team, score))
 
-    # Sort by score descending
-    results.sort(key=lambda x: x[1], reverse=True)
+    # Top results by score descending (O(n log k) instead of a full sort)
+    return heapq.nlargest(max_results, results, key=lambda x: x[1])
+
+
+def _top_indices(row: np.ndarray, threshold: float, count: int) -> list[int]:
+    """Indices of the `count` best scores >= threshold, ties kept in input order"""
+    eligible = np.flatnonzero(row >= threshold)
+    if count <= 0 or eligible.size == 0:
+        return []
+    if eligible.size > count:
+        # Partition instead of sorting; cut ties at the boundary by position
+        values = row[eligible]
+        kth = np.partition(values, eligible.size - count)[eligible.size - count]
+        above = eligible[values > kth]
+        at_kth = eligible[values == kth][: count - above.size]
+        eligible = np.concatenate((above, at_kth))
+    return sorted(eligible.tolist(), key=lambda j: (-row[j], j))
 
-    return results[:max_results]
+
+def fuzzy_search_teams_batch(
+    queries: list[str], known_teams: list[str], threshold: float = 0.6, max_results: int = 5
+) -> list[list[tuple[str, float]]]:
+    """
+    Fuzzy match many queries at once, with the same scoring as fuzzy_search_teams
+
+    The query x team similarity matrix is computed by RapidFuzz's cdist, which
+    runs in parallel native threads, so large batches avoid per-pair Python calls.
+
+    Returns:
+        One list of (team_name, similarity_score) tuples per query
+    """
+    if not queries:
+        return []
+
+    queries_normalized = [normalize_text(query) for query in queries]
+    teams_normalized = [normalize_text(team) for team in known_teams]
+    score_cutoff = max(threshold * 100.0 - 1e-6, 0.0)
+
+    scores = process.cdist(
+        queries_normalized,
+        teams_normalized,
+        scorer=fuzz.ratio,
+        processor=None,
+        dtype=np.float64,
+        workers=-1,
+    )
+
+    # Substring boost, as in the single-query search. A string contained in another
+    # has the highest ratio their lengths allow (200 * shorter / total), so only
+    # cells at that bound need the exact substring check. A boost to 0.8 cannot
+    # pass a higher threshold, so it is skipped then.
+    if threshold <= 0.8:
+        query_lengths = np.fromiter(map(len, queries_normalized), dtype=np.float64)
+        team_lengths = np.fromiter(map(len, teams_normalized), dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = 200.0 * np.minimum.outer(query_lengths, team_lengths)
+            bound /= np.add.outer(query_lengths, team_lengths)
+        rows, columns = np.nonzero((scores < 80.0) & (scores >= bound - 1e-6))
+        for row_index, column in zip(rows.tolist(), columns.tolist(), strict=True):
+            query_normalized = queries_normalized[row_index]
+            team_normalized = teams_normalized[column]
+            if query_normalized in team_normalized or team_normalized in query_normalized:
+                scores[row_index, column] = 80.0
+
+    # Best alias score per team column
+    alias_columns = [
+        (column, _ALIAS_SPANS[team])
+        for column, team in enumerate(teams_normalized)
+        if team in _ALIAS_SPANS
+    ]
+    if alias_columns:
+        alias_scores = process.cdist(
+            queries_normalized,
+            _ALIASES_FLAT,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=-1,
+        )
+        for column, span in alias_columns:
+            np.maximum(scores[:, column], alias_scores[:, span].max(axis=1), out=scores[:, column])
+
+    scores /= 100.0
+
+    # Columns of each normalized team name, to drop an alias hit without a scan
+    team_columns: dict[str, list[int]] = {}
+    for column, team_normalized in enumerate(teams_normalized):
+        team_columns.setdefault(team_normalized, []).append(column)
+
+    batch_results = []
+    for row_index, query in enumerate(queries):
+        row = scores[row_index]
+
+        results = []
+        alias_match = find_by_alias(query)
+        if alias_match and max_results > 0:
+            results.append((alias_match, 1.0))
+            row[team_columns.get(normalize_text(alias_match), [])] = -1.0
+
+        for column in _top_indices(row, threshold, max_results - len(results)):
+            results.append((known_teams[column], float(row[column])))
+        batch_results.append(results)
+
+    return batch_results
+
+
+@lru_cache(maxsize=1024)
+def _cached_matches(query: str, all_teams: frozenset[str]) -> tuple[tuple[str, float], ...]:
+    """Ranked matches for suggest_corrections, memoized per (query, team catalog)"""
+    return tuple(fuzzy_search_teams(query, list(all_teams), threshold=0.5))
 
 
 def suggest_corrections(query: str, known_teams: list[str]) -> dict:
@@ -228,10 +411,9 @@ def suggest_corrections(query: str, known_teams: list[str]) -> dict:
         }
     """
     # Add common teams to known teams if not present
-    all_teams = set(known_teams)
-    all_teams.update([name.title() for name in TEAM_ALIASES])
+    all_teams = _ALIAS_TEAM_TITLES.union(known_teams)
 
-    matches = fuzzy_search_teams(query, list(all_teams), threshold=0.5)
+    matches = _cached_matches(query, all_teams)
 
     suggestions = []
     for name, score in matches:
@@ -268,43 +450,82 @@ def get_team_info(team_name: str) -> dict:
     }
 
 
+# Trie node key holding the teams stored at that node (never clashes with a character)
+_TRIE_TEAMS = ""
+
+
+class _PrefixTrie:
+    """Character trie mapping normalized names to the teams they belong to"""
+
+    __slots__ = ("_root",)
+
+    def __init__(self):
+        self._root: dict = {}
+
+    def add(self, key: str, team: str) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(_TRIE_TEAMS, set()).add(team)
+
+    def teams_with_prefix(self, prefix: str) -> set[str]:
+        """All teams with a key starting with prefix: O(len(prefix) + matches)"""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+
+        found = set()
+        stack = [node]
+        while stack:
+            for char, child in stack.pop().items():
+                if char == _TRIE_TEAMS:
+                    found |= child
+                else:
+                    stack.append(child)
+        return found
+
+
+@lru_cache(maxsize=8)
+def _autocomplete_tries(teams: frozenset[str]) -> tuple[_PrefixTrie, _PrefixTrie, _PrefixTrie]:
+    """
+    Build (full name, word, alias) prefix tries for a team catalog
+
+    Cached by catalog, so repeated keystrokes against the same team list only
+    walk the tries instead of rescanning every team.
+    """
+    names, words, aliases = _PrefixTrie(), _PrefixTrie(), _PrefixTrie()
+    for team in teams:
+        team_normalized = normalize_text(team)
+        names.add(team_normalized, team)
+        for word in team_normalized.split():
+            words.add(word, team)
+        for alias_normalized in _ALIASES_NORM.get(team_normalized, ()):
+            aliases.add(alias_normalized, team)
+    return names, words, aliases
+
+
 def auto_complete(prefix: str, known_teams: list[str], limit: int = 10) -> list[str]:
     """
     Autocomplete team names based on prefix
+
+    Teams whose name starts with the prefix come first, then teams with a
+    word starting with it, then teams with a matching alias; alphabetical
+    within each tier.
     """
     prefix_normalized = normalize_text(prefix)
 
-    matches = []
-
     # Add teams from aliases
-    all_teams = set(known_teams)
-    all_teams.update([name.title() for name in TEAM_ALIASES])
-
-    for team in all_teams:
-        team_normalized = normalize_text(team)
-
-        # Check if team starts with prefix
-        if team_normalized.startswith(prefix_normalized):
-            matches.append((team, 1.0))
-        # Check if any word starts with prefix
-        elif any(word.startswith(prefix_normalized) for word in team_normalized.split()):
-            matches.append((team, 0.9))
-        # Check aliases
-        elif team_normalized in TEAM_ALIASES:
-            for alias in TEAM_ALIASES[team_normalized]:
-                if normalize_text(alias).startswith(prefix_normalized):
-                    matches.append((team, 0.8))
-                    break
-
-    # Sort and return unique
-    matches.sort(key=lambda x: (-x[1], x[0]))
-    seen = set()
-    result = []
-    for team, _ in matches:
-        if team not in seen:
-            seen.add(team)
-            result.append(team)
-            if len(result) >= limit:
-                break
+    all_teams = _ALIAS_TEAM_TITLES.union(known_teams)
+
+    result: list[str] = []
+    seen: set[str] = set()
+    for trie in _autocomplete_tries(all_teams):
+        tier = trie.teams_with_prefix(prefix_normalized) - seen
+        seen |= tier
+        result.extend(heapq.nsmallest(limit - len(result), tier))
+        if len(result) >= limit:
+            break
 
     return result
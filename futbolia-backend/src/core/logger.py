@@ -3,12 +3,14 @@ FutbolIA - Structured Logger
 Centralized logging with JSON format for production
 """
 
-import json
 import logging
 import sys
+import time
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
+
 from src.core.config import settings
 
 
@@ -17,7 +19,8 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            # Record creation time; orjson serializes it to ISO 8601 natively
+            "timestamp": datetime.fromtimestamp(record.created, UTC),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -33,7 +36,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -59,8 +62,8 @@ class ColoredFormatter(logging.Formatter):
         color = self.COLORS.get(record.levelname, "")
         icon = self.ICONS.get(record.levelname, "")
 
-        # Format timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Format timestamp from the record's creation time (local time, as before)
+        timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
 
         # Build message
         message = (
@@ -116,40 +119,32 @@ def _get_default_logger() -> logging.Logger:
     return _default_logger
 
 
+def _log(level: int, message: str, data: dict[str, Any]) -> None:
+    """Emit on the default logger, skipping the extra dict when the level is disabled"""
+    logger = _get_default_logger()
+    if logger.isEnabledFor(level):
+        # stacklevel=2 keeps the public wrapper as the record's function, as before
+        logger.log(level, message, extra={"extra_data": data} if data else None, stacklevel=2)
+
+
 def log_info(message: str, **kwargs: Any) -> None:
     """Quick info log"""
-    logger = _get_default_logger()
-    if kwargs:
-        logger.info(message, extra={"extra_data": kwargs})
-    else:
-        logger.info(message)
+    _log(logging.INFO, message, kwargs)
 
 
 def log_warning(message: str, **kwargs: Any) -> None:
     """Quick warning log"""
-    logger = _get_default_logger()
-    if kwargs:
-        logger.warning(message, extra={"extra_data": kwargs})
-    else:
-        logger.warning(message)
+    _log(logging.WARNING, message, kwargs)
 
 
 def log_error(message: str, **kwargs: Any) -> None:
     """Quick error log"""
-    logger = _get_default_logger()
-    if kwargs:
-        logger.error(message, extra={"extra_data": kwargs})
-    else:
-        logger.error(message)
+    _log(logging.ERROR, message, kwargs)
 
 
 def log_debug(message: str, **kwargs: Any) -> None:
     """Quick debug log"""
-    logger = _get_default_logger()
-    if kwargs:
-        logger.debug(message, extra={"extra_data": kwargs})
-    else:
-        logger.debug(message)
+    _log(logging.DEBUG, message, kwargs)
 
 
 def log_prediction(
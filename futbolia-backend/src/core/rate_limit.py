@@ -3,8 +3,10 @@ FutbolIA - Rate Limiting Middleware
 Protects API endpoints from abuse
 """
 
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache, wraps
 
 from fastapi import HTTPException, Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -13,6 +15,14 @@ from starlette.responses import JSONResponse, Response
 from src.core.logger import log_warning
 
 
+@lru_cache(maxsize=1024)
+def _first_forwarded_ip(forwarded: str) -> str:
+    """Client IP from an X-Forwarded-For value (the first hop)"""
+    if "," not in forwarded:
+        return forwarded.strip()
+    return forwarded.split(",", 1)[0].strip()
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware using sliding window algorithm
@@ -23,13 +33,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - Different limits for different endpoints
     """
 
+    # Upper bound on tracked identifiers; the least recently seen is dropped first
+    MAX_TRACKED_IDENTIFIERS = 100_000
+    # Minimum seconds between "Rate limit exceeded" warnings (a flood would swamp the logs)
+    LIMIT_LOG_INTERVAL = 1.0
+
     def __init__(self, app, default_limit: int = 60, window_seconds: int = 60):
         super().__init__(app)
         self.default_limit = default_limit
         self.window_seconds = window_seconds
 
-        # Storage: {identifier: [(timestamp, count), ...]}
-        self.requests: dict[str, list] = defaultdict(list)
+        # Storage: {identifier: deque of request timestamps, oldest first}, in LRU order
+        self.requests: OrderedDict[str, deque[float]] = OrderedDict()
+        self._next_sweep = 0.0
+        self._last_limit_log = float("-inf")
+        self._suppressed_limit_logs = 0
 
         # Endpoint-specific limits (requests per minute)
         self.endpoint_limits = {
@@ -39,25 +57,44 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "/api/v1/auth/login": 30,  # Prevent brute force
         }
 
-        # Whitelist (no rate limiting)
-        self.whitelist = {
-            "/health",
-            "/docs",
-            "/openapi.json",
-            "/",
+        # All endpoint prefixes compiled into one alternation; re tries the
+        # alternatives left to right, so the first matching endpoint still wins
+        self._prefix_limits: dict[str, int] = {}
+        for endpoint, limit in self.endpoint_limits.items():
+            self._prefix_limits.setdefault(endpoint.rstrip("/"), limit)
+        self._prefix_pattern = re.compile("|".join(map(re.escape, self._prefix_limits)))
+
+        # Clients hit the same few paths over and over; memoize limit resolution
+        self._get_limit = lru_cache(maxsize=1024)(self._get_limit)
+
+        # X-RateLimit-Limit header values, formatted once per distinct limit
+        self._limit_headers = {
+            limit: str(limit) for limit in (*self.endpoint_limits.values(), default_limit)
         }
 
+        # Whitelist (no rate limiting)
+        self.whitelist = frozenset(
+            {
+                "/health",
+                "/docs",
+                "/openapi.json",
+                "/",
+            }
+        )
+
     def _get_identifier(self, request: Request) -> str:
         """Get unique identifier for the request (IP or user_id)"""
-        # Try to get user from request state (set by auth middleware)
-        user_id = getattr(request.state, "user_id", None)
+        # Try to get user from request state (set by auth middleware). Read the
+        # scope's state dict directly: a missing key on request.state costs a
+        # State allocation plus a raised and caught AttributeError
+        user_id = request.scope.get("state", {}).get("user_id")
         if user_id:
             return f"user:{user_id}"
 
         # Fall back to IP address
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            ip = forwarded.split(",")[0].strip()
+            ip = _first_forwarded_ip(forwarded)
         else:
             ip = request.client.host if request.client else "unknown"
 
@@ -70,60 +107,97 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return self.endpoint_limits[path]
 
         # Check prefix match
-        for endpoint, limit in self.endpoint_limits.items():
-            if path.startswith(endpoint.rstrip("/")):
-                return limit
+        match = self._prefix_pattern.match(path) if self._prefix_limits else None
+        if match:
+            return self._prefix_limits[match.group()]
 
         return self.default_limit
 
-    def _clean_old_requests(self, identifier: str, now: float) -> None:
-        """Remove requests outside the current window"""
+    def _clean_old_requests(self, identifier: str, now: float) -> deque[float]:
+        """Remove requests outside the current window and return the identifier's timestamps"""
+        cutoff = now - self.window_seconds
+        timestamps = self.requests.get(identifier)
+        if timestamps is None:
+            if len(self.requests) >= self.MAX_TRACKED_IDENTIFIERS:
+                self.requests.popitem(last=False)
+            timestamps = self.requests[identifier] = deque()
+            return timestamps
+
+        self.requests.move_to_end(identifier)
+        # Timestamps are appended in order, so expired ones are always at the front
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        return timestamps
+
+    def _sweep_idle_identifiers(self, now: float) -> None:
+        """Drop identifiers at the LRU end whose requests have all left the window"""
         cutoff = now - self.window_seconds
-        self.requests[identifier] = [ts for ts in self.requests[identifier] if ts > cutoff]
+        while self.requests:
+            timestamps = next(iter(self.requests.values()))
+            if timestamps and timestamps[-1] > cutoff:
+                break
+            self.requests.popitem(last=False)
 
     def _is_rate_limited(self, identifier: str, limit: int) -> tuple[bool, int, int]:
         """
         Check if identifier is rate limited
         Returns: (is_limited, current_count, reset_time)
         """
-        now = time.time()
-        self._clean_old_requests(identifier, now)
-
-        current_count = len(self.requests[identifier])
+        # Monotonic clock: windows are unaffected by wall-clock adjustments
+        now = time.monotonic()
+        # Once per window, forget one-shot identifiers so idle clients don't pile up
+        if now >= self._next_sweep:
+            self._sweep_idle_identifiers(now)
+            self._next_sweep = now + self.window_seconds
+        # Look the identifier's timestamps up once and work on the local deque
+        timestamps = self._clean_old_requests(identifier, now)
+
+        current_count = len(timestamps)
         reset_time = (
-            int(self.window_seconds - (now - self.requests[identifier][0]))
-            if self.requests[identifier]
-            else self.window_seconds
+            int(self.window_seconds - (now - timestamps[0])) if timestamps else self.window_seconds
         )
 
         if current_count >= limit:
             return True, current_count, reset_time
 
         # Record this request
-        self.requests[identifier].append(now)
+        timestamps.append(now)
         return False, current_count + 1, reset_time
 
+    def _log_limit_exceeded(self, identifier: str, path: str, limit: int, count: int) -> None:
+        """Warn about a rejected request, at most once per LIMIT_LOG_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_limit_log < self.LIMIT_LOG_INTERVAL:
+            self._suppressed_limit_logs += 1
+            return
+
+        log_warning(
+            "Rate limit exceeded",
+            identifier=identifier,
+            path=path,
+            limit=limit,
+            count=count,
+            suppressed=self._suppressed_limit_logs,
+        )
+        self._last_limit_log = now
+        self._suppressed_limit_logs = 0
+
     async def dispatch(self, request: Request, call_next) -> Response:
         """Process request with rate limiting"""
         path = request.url.path
 
-        # Skip whitelist
-        if path in self.whitelist:
-            return await call_next(request)
-
-        # Skip OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
+        # Skip whitelist and OPTIONS requests (CORS preflight)
+        if path in self.whitelist or request.method == "OPTIONS":
             return await call_next(request)
 
         identifier = self._get_identifier(request)
         limit = self._get_limit(path)
 
         is_limited, count, reset_time = self._is_rate_limited(identifier, limit)
+        limit_header = self._limit_headers[limit]
 
         if is_limited:
-            log_warning(
-                "Rate limit exceeded", identifier=identifier, path=path, limit=limit, count=count
-            )
+            self._log_limit_exceeded(identifier, path, limit, count)
             # Return JSON response directly instead of raising HTTPException
             # This ensures proper 429 status code instead of 500
             return JSONResponse(
@@ -136,7 +210,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 headers={
                     "Retry-After": str(reset_time),
-                    "X-RateLimit-Limit": str(limit),
+                    "X-RateLimit-Limit": limit_header,
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Reset": str(reset_time),
                 },
@@ -144,7 +218,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Add rate limit headers to response
         response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(limit)
+        response.headers["X-RateLimit-Limit"] = limit_header
         response.headers["X-RateLimit-Remaining"] = str(limit - count)
         response.headers["X-RateLimit-Reset"] = str(reset_time)
 
@@ -166,26 +240,29 @@ class RateLimiter:
     def __init__(self, limit: int = 10, window: int = 60):
         self.limit = limit
         self.window = window
-        self.requests: dict[str, list] = defaultdict(list)
+        self.requests: dict[str, deque[float]] = defaultdict(deque)
 
     def __call__(self, func):
-        async def wrapper(*args, **kwargs):
-            # Use function name as key
-            key = f"{func.__module__}.{func.__name__}"
+        # Use function name as key; the function's deque is resolved once, not per call
+        key = f"{func.__module__}.{func.__name__}"
+        timestamps = self.requests[key]
 
-            now = time.time()
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            now = time.monotonic()
             cutoff = now - self.window
 
-            # Clean old requests
-            self.requests[key] = [ts for ts in self.requests[key] if ts > cutoff]
+            # Clean old requests (expired timestamps sit at the front)
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
 
-            if len(self.requests[key]) >= self.limit:
+            if len(timestamps) >= self.limit:
                 raise HTTPException(
                     status_code=429,
                     detail=f"Function rate limit exceeded. Max {self.limit} calls per {self.window}s",
                 )
 
-            self.requests[key].append(now)
+            timestamps.append(now)
             return await func(*args, **kwargs)
 
         return wrapper
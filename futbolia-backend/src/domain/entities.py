@@ -6,6 +6,10 @@ Core business objects that represent the football prediction domain
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
+from functools import partial
+
+# Timestamp default factory; a partial calls datetime.now directly, without a lambda frame
+_utc_now = partial(datetime.now, UTC)
 
 
 class MatchStatus(StrEnum):
@@ -26,7 +30,7 @@ class PredictionOutcome(StrEnum):
     DRAW = "draw"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity for authentication"""
 
@@ -35,7 +39,7 @@ class User:
     username: str = ""
     hashed_password: str = ""
     is_active: bool = True
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utc_now)
     language: str = "es"  # Default language
     theme: str = "dark"  # Default theme
 
@@ -51,7 +55,7 @@ class User:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerAttributes:
     """Player attributes from FIFA dataset (ChromaDB)"""
 
@@ -92,7 +96,7 @@ class PlayerAttributes:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Player entity with basic info"""
 
@@ -104,7 +108,7 @@ class Player:
     attributes: PlayerAttributes | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Team entity"""
 
@@ -139,14 +143,14 @@ class Team:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Match entity representing a football game"""
 
     id: str = ""
     home_team: Team | None = None
     away_team: Team | None = None
-    date: datetime = field(default_factory=lambda: datetime.now(UTC))
+    date: datetime = field(default_factory=_utc_now)
     venue: str = ""
     league: str = ""
     status: MatchStatus = MatchStatus.SCHEDULED
@@ -167,7 +171,7 @@ class Match:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionResult:
     """The AI-generated prediction result"""
 
@@ -182,7 +186,7 @@ class PredictionResult:
     tactical_insight: str = ""  # Specific tactical insight
 
 
-@dataclass
+@dataclass(slots=True)
 class Prediction:
     """Complete prediction entity stored in database"""
 
@@ -190,7 +194,7 @@ class Prediction:
     user_id: str = ""
     match: Match | None = None
     result: PredictionResult | None = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utc_now)
     is_correct: bool | None = None  # Verified after match ends
     language: str = "es"
 
@@ -207,8 +211,8 @@ class Prediction:
                 "key_factors": self.result.key_factors,
                 "star_player_home": self.result.star_player_home,
                 "star_player_away": self.result.star_player_away,
-                "match_preview": getattr(self.result, "match_preview", ""),
-                "tactical_insight": getattr(self.result, "tactical_insight", ""),
+                "match_preview": self.result.match_preview,
+                "tactical_insight": self.result.tactical_insight,
             }
             if self.result
             else None,
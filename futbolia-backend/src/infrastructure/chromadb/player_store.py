@@ -5,14 +5,32 @@ Stores and retrieves player attributes for RAG-based predictions
 
 from __future__ import annotations
 
+import heapq
 import os
+from collections.abc import Sequence
+from dataclasses import fields
+from functools import lru_cache
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 
 from src.core.config import settings
+from src.core.logger import get_logger
 from src.domain.entities import PlayerAttributes
 
+logger = get_logger(__name__)
+
+_PLAYER_FIELDS = frozenset(f.name for f in fields(PlayerAttributes))
+
+# Document text embedded for each player, filled from PlayerAttributes.to_dict()
+_DOC_TEMPLATE = (
+    "Player: {name}, Team: {team}, Position: {position}. "
+    "Overall Rating: {overall_rating}. "
+    "Attributes - Pace: {pace}, Shooting: {shooting}, "
+    "Passing: {passing}, Dribbling: {dribbling}, "
+    "Defending: {defending}, Physical: {physical}."
+)
+
 
 class PlayerVectorStore:
     """Vector store for player attributes using ChromaDB"""
@@ -20,6 +38,14 @@ class PlayerVectorStore:
     _client: chromadb.Client | None = None
     _collection = None
 
+    # Rows per collection.add call; large single adds slow down HNSW inserts
+    ADD_BATCH_SIZE = max(settings.CHROMA_ADD_BATCH_SIZE, 1)
+
+    # In-memory team -> players (insertion order), loaded once from the collection
+    # metadata; team lookups are served from RAM and Chroma is write-through
+    _team_index: dict[str, list[PlayerAttributes]] = {}
+    _indexed_ids: dict[str, str] = {}  # player id -> team
+
     @classmethod
     def initialize(cls) -> None:
         """Initialize ChromaDB client and collection"""
@@ -37,8 +63,65 @@ class PlayerVectorStore:
             metadata={"description": "FIFA Player Attributes for tactical analysis"},
         )
 
-        print(f"✅ ChromaDB initialized: {settings.CHROMA_COLLECTION_NAME}")
-        print(f"📊 Collection has {cls._collection.count()} players")
+        cls._rebuild_team_index()
+
+        logger.info("✅ ChromaDB initialized: %s", settings.CHROMA_COLLECTION_NAME)
+        logger.info("📊 Collection has %d players", cls._collection.count())
+
+    @classmethod
+    def ensure_initialized(cls) -> None:
+        """Initialize the store unless it is already open"""
+        if cls._collection is None:
+            cls.initialize()
+
+    @classmethod
+    def _write(cls, players: Sequence[PlayerAttributes], upsert: bool = False, **kwargs) -> None:
+        """Write players to the collection (add or upsert), then index them"""
+        # Synchronous on purpose: a failure reaches the caller before anything
+        # reports the players as stored, and the index never holds unstored players
+        if upsert:
+            cls._collection.upsert(**kwargs)
+        else:
+            cls._collection.add(**kwargs)
+        for player in players:
+            cls._index_player(player.player_id, player, replace=upsert)
+
+    @classmethod
+    def _rebuild_team_index(cls) -> None:
+        """Rebuild the team -> players index from the collection metadata"""
+        cls._team_index = {}
+        cls._indexed_ids = {}
+        cls._cached_star_players.cache_clear()
+
+        results = cls._collection.get(include=["metadatas"])
+        if results and results.get("ids"):
+            players = cls._metadatas_to_players(results["metadatas"])
+            for player_id, player in zip(results["ids"], players, strict=False):
+                cls._index_player(player_id, player)
+
+    @classmethod
+    def _index_player(cls, player_id: str, player: PlayerAttributes, replace: bool = False) -> None:
+        """Register a stored player under its team (ids already stored keep their data)"""
+        if not player.team:
+            return
+        if player_id in cls._indexed_ids:
+            if not replace:
+                return
+            cls._unindex_player(player_id)
+        cls._indexed_ids[player_id] = player.team
+        cls._team_index.setdefault(player.team, []).append(player)
+        # A team's roster changed, so cached star players may be stale
+        cls._cached_star_players.cache_clear()
+
+    @classmethod
+    def _unindex_player(cls, player_id: str) -> None:
+        """Remove a player from its team in the index"""
+        team = cls._indexed_ids.pop(player_id)
+        roster = [p for p in cls._team_index[team] if p.player_id != player_id]
+        if roster:
+            cls._team_index[team] = roster
+        else:
+            del cls._team_index[team]
 
     @classmethod
     def add_player(cls, player: PlayerAttributes) -> None:
@@ -47,22 +130,21 @@ class PlayerVectorStore:
             cls.initialize()
 
         # Create document text for embedding
-        document = (
-            f"Player: {player.name}, Team: {player.team}, Position: {player.position}. "
-            f"Overall Rating: {player.overall_rating}. "
-            f"Attributes - Pace: {player.pace}, Shooting: {player.shooting}, "
-            f"Passing: {player.passing}, Dribbling: {player.dribbling}, "
-            f"Defending: {player.defending}, Physical: {player.physical}."
-        )
+        metadata = player.to_dict()
+        document = _DOC_TEMPLATE.format_map(metadata)
 
         # Add to collection
-        cls._collection.add(
-            ids=[player.player_id], documents=[document], metadatas=[player.to_dict()]
-        )
+        cls._write([player], ids=[player.player_id], documents=[document], metadatas=[metadata])
 
     @classmethod
-    def add_players_batch(cls, players: list[PlayerAttributes]) -> None:
-        """Add multiple players to the vector store"""
+    def add_players_batch(cls, players: Sequence[PlayerAttributes], replace: bool = False) -> None:
+        """
+        Add multiple players to the vector store
+
+        Args:
+            players: Players to store
+            replace: If True, overwrite players whose id is already stored (upsert)
+        """
         if cls._collection is None:
             cls.initialize()
 
@@ -71,18 +153,21 @@ class PlayerVectorStore:
         metadatas = []
 
         for player in players:
+            metadata = player.to_dict()
             ids.append(player.player_id)
-            documents.append(
-                f"Player: {player.name}, Team: {player.team}, Position: {player.position}. "
-                f"Overall Rating: {player.overall_rating}. "
-                f"Attributes - Pace: {player.pace}, Shooting: {player.shooting}, "
-                f"Passing: {player.passing}, Dribbling: {player.dribbling}, "
-                f"Defending: {player.defending}, Physical: {player.physical}."
+            documents.append(_DOC_TEMPLATE.format_map(metadata))
+            metadatas.append(metadata)
+
+        for start in range(0, len(ids), cls.ADD_BATCH_SIZE):
+            end = start + cls.ADD_BATCH_SIZE
+            cls._write(
+                players[start:end],
+                upsert=replace,
+                ids=ids[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
             )
-            metadatas.append(player.to_dict())
-
-        cls._collection.add(ids=ids, documents=documents, metadatas=metadatas)
-        print(f"✅ Added {len(players)} players to vector store")
+        logger.info("✅ Added %d players to the vector store", len(players))
 
     @classmethod
     def search_by_team(cls, team_name: str, limit: int = 11) -> list[PlayerAttributes]:
@@ -90,26 +175,14 @@ class PlayerVectorStore:
         if cls._collection is None:
             cls.initialize()
 
-        # First try exact match with where filter
-        try:
-            results = cls._collection.query(
-                query_texts=[f"Team: {team_name}"],
-                n_results=limit,
-                where={"team": {"$eq": team_name}},
-            )
-
-            players = cls._results_to_players(results)
-
-            # Only return if we found players for THIS team
-            if players and all(p.team.lower() == team_name.lower() for p in players):
-                print(f"✅ Found {len(players)} players for {team_name} in ChromaDB")
-                return players
-
-        except Exception as e:
-            print(f"⚠️ ChromaDB query error: {e}")
+        # Exact team match served from the in-memory index: no ChromaDB round trip
+        players = cls._team_index.get(team_name, [])[:limit]
+        if players:
+            logger.debug("✅ Found %d players for %s in ChromaDB", len(players), team_name)
+            return players
 
         # No exact match found - return empty to trigger AI generation
-        print(f"⚠️ No players found in ChromaDB for '{team_name}' - will use AI generation")
+        logger.debug("⚠️ No players found in ChromaDB for '%s' - will use AI generation", team_name)
         return []
 
     @classmethod
@@ -125,11 +198,16 @@ class PlayerVectorStore:
     @classmethod
     def get_star_players(cls, team_name: str, top_n: int = 3) -> list[PlayerAttributes]:
         """Get top rated players from a team"""
+        return list(cls._cached_star_players(team_name, top_n))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _cached_star_players(cls, team_name: str, top_n: int) -> tuple[PlayerAttributes, ...]:
+        """Top N players of a team, memoized until the team index changes"""
         players = cls.search_by_team(team_name, limit=20)
 
-        # Sort by overall rating and return top N
-        sorted_players = sorted(players, key=lambda p: p.overall_rating, reverse=True)
-        return sorted_players[:top_n]
+        # Top N by overall rating (same order as a stable descending sort)
+        return tuple(heapq.nlargest(top_n, players, key=lambda p: p.overall_rating))
 
     @classmethod
     def get_player_comparison(cls, team_a: str, team_b: str) -> dict:
@@ -142,12 +220,22 @@ class PlayerVectorStore:
             if not players:
                 return {"pace": 0, "shooting": 0, "passing": 0, "defending": 0, "overall": 0}
 
+            # Single pass with local accumulators (squads here are top-N, N=3)
+            pace = shooting = passing = defending = overall = 0
+            for p in players:
+                pace += p.pace
+                shooting += p.shooting
+                passing += p.passing
+                defending += p.defending
+                overall += p.overall_rating
+
+            n = len(players)
             return {
-                "pace": sum(p.pace for p in players) // len(players),
-                "shooting": sum(p.shooting for p in players) // len(players),
-                "passing": sum(p.passing for p in players) // len(players),
-                "defending": sum(p.defending for p in players) // len(players),
-                "overall": sum(p.overall_rating for p in players) // len(players),
+                "pace": pace // n,
+                "shooting": shooting // n,
+                "passing": passing // n,
+                "defending": defending // n,
+                "overall": overall // n,
             }
 
         return {
@@ -170,6 +258,20 @@ class PlayerVectorStore:
             cls.initialize()
         return cls._collection.count()
 
+    @classmethod
+    def get_metadata(cls, key: str) -> str | int | float | bool | None:
+        """Read a value from the collection metadata"""
+        if cls._collection is None:
+            cls.initialize()
+        return (cls._collection.metadata or {}).get(key)
+
+    @classmethod
+    def set_metadata(cls, key: str, value: str | int | float | bool) -> None:
+        """Store a value in the collection metadata, keeping the other keys"""
+        if cls._collection is None:
+            cls.initialize()
+        cls._collection.modify(metadata={**(cls._collection.metadata or {}), key: value})
+
     @classmethod
     def clear_all(cls) -> None:
         """Clear all players from the vector store"""
@@ -179,16 +281,17 @@ class PlayerVectorStore:
         # Delete and recreate collection
         try:
             cls._client.delete_collection(settings.CHROMA_COLLECTION_NAME)
-            print(f"🗑️ Deleted collection: {settings.CHROMA_COLLECTION_NAME}")
+            logger.info("🗑️ Deleted collection: %s", settings.CHROMA_COLLECTION_NAME)
         except Exception as e:
-            print(f"⚠️ Error deleting collection: {e}")
+            logger.warning("⚠️ Error deleting collection: %s", e)
 
         # Recreate collection
         cls._collection = cls._client.get_or_create_collection(
             name=settings.CHROMA_COLLECTION_NAME,
             metadata={"description": "FIFA Player Attributes for tactical analysis"},
         )
-        print(f"✅ Recreated collection: {settings.CHROMA_COLLECTION_NAME}")
+        cls._rebuild_team_index()
+        logger.info("✅ Recreated collection: %s", settings.CHROMA_COLLECTION_NAME)
 
     @classmethod
     def get_all_teams(cls) -> list[str]:
@@ -196,37 +299,29 @@ class PlayerVectorStore:
         if cls._collection is None:
             cls.initialize()
 
-        # Get all documents
-        results = cls._collection.get(include=["metadatas"])
+        # The team index already holds every team with stored players
+        return sorted(cls._team_index)
 
-        teams = set()
+    @classmethod
+    def _results_to_players(cls, results: dict) -> list[PlayerAttributes]:
+        """Convert ChromaDB query results to PlayerAttributes list"""
         if results and results.get("metadatas"):
-            for metadata in results["metadatas"]:
-                if metadata.get("team"):
-                    teams.add(metadata["team"])
-
-        return sorted(list(teams))
+            return cls._metadatas_to_players(results["metadatas"][0])
+        return []
 
     @staticmethod
-    def _results_to_players(results: dict) -> list[PlayerAttributes]:
-        """Convert ChromaDB results to PlayerAttributes list"""
+    def _metadatas_to_players(metadatas: list[dict]) -> list[PlayerAttributes]:
+        """Convert a flat list of ChromaDB metadatas to PlayerAttributes list"""
+        # Metadata is written from PlayerAttributes.to_dict(), so keys match the
+        # dataclass fields and missing ones fall back to the same defaults
         players = []
-
-        if results and results.get("metadatas"):
-            for metadata in results["metadatas"][0]:
-                player = PlayerAttributes(
-                    player_id=metadata.get("player_id", ""),
-                    name=metadata.get("name", ""),
-                    team=metadata.get("team", ""),
-                    position=metadata.get("position", ""),
-                    overall_rating=metadata.get("overall_rating", 0),
-                    pace=metadata.get("pace", 0),
-                    shooting=metadata.get("shooting", 0),
-                    passing=metadata.get("passing", 0),
-                    dribbling=metadata.get("dribbling", 0),
-                    defending=metadata.get("defending", 0),
-                    physical=metadata.get("physical", 0),
+        for metadata in metadatas or ():
+            try:
+                players.append(PlayerAttributes(**metadata))
+            except TypeError:
+                # Rows carrying unknown keys: keep only the known fields
+                players.append(
+                    PlayerAttributes(**{k: v for k, v in metadata.items() if k in _PLAYER_FIELDS})
                 )
-                players.append(player)
 
         return players
@@ -5,6 +5,8 @@ Evita llamadas API en tiempo real usando datasets pre-descargados
 """
 
 import json
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -42,25 +44,46 @@ class DatasetManager:
         self.players_dir = self.data_dir / "players"
 
         # Cache en memoria para acceso ultrarrápido
-        self._memory_cache: dict[str, tuple[Any, datetime]] = {}
-        self._cache_ttl = timedelta(minutes=30)  # TTL de cache en memoria
+        # Marcas de tiempo con time.monotonic(): más baratas que datetime.now()
+        # OrderedDict: sacar del frente es O(1), sin huecos que recorrer como en un dict
+        self._memory_cache: OrderedDict[tuple, tuple[Any, float]] = OrderedDict()
+        self._cache_ttl = 30 * 60  # TTL de cache en memoria (segundos)
 
-    def _cache_key(self, *args) -> str:
-        """Generar clave de cache"""
-        return ":".join(str(a) for a in args)
+    def _cache_key(self, *args) -> tuple:
+        """Generar clave de cache (la tupla se usa directamente, sin formatear ni hashear)"""
+        return args
 
-    def _get_from_cache(self, key: str) -> Any | None:
+    def _get_from_cache(self, key: tuple) -> Any | None:
         """Obtener de cache en memoria si no expiró"""
         if key in self._memory_cache:
             data, cached_at = self._memory_cache[key]
-            if datetime.now() - cached_at < self._cache_ttl:
+            if time.monotonic() - cached_at < self._cache_ttl:
                 return data
             del self._memory_cache[key]
         return None
 
-    def _set_cache(self, key: str, data: Any):
+    def _set_cache(self, key: tuple, data: Any):
         """Guardar en cache en memoria"""
-        self._memory_cache[key] = (data, datetime.now())
+        now = time.monotonic()
+        self._evict_expired(now)
+        # Reinsertar al final para que el orden del dict sea el orden de expiración
+        self._memory_cache.pop(key, None)
+        self._memory_cache[key] = (data, now)
+
+    def _evict_expired(self, now: float):
+        """
+        Eliminar entradas expiradas desde el frente del cache
+
+        Todas las entradas comparten el mismo TTL y se insertan en orden
+        cronológico, así que basta con sacar del frente hasta encontrar una
+        vigente: O(eliminadas), sin recorrer ni ordenar todo el cache.
+        """
+        cache = self._memory_cache
+        while cache:
+            _, cached_at = next(iter(cache.values()))
+            if now - cached_at < self._cache_ttl:
+                break
+            cache.popitem(last=False)
 
     def _load_json_sync(self, filepath: Path) -> Any | None:
         """Cargar JSON de forma síncrona (más rápido para archivos pequeños)"""
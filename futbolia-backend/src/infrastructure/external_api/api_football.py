@@ -15,8 +15,11 @@ import httpx
 
 from src.core.cache import squad_cache, team_cache
 from src.core.config import settings
+from src.core.logger import get_logger
 from src.domain.entities import Team
 
+logger = get_logger(__name__)
+
 
 class APIFootballClient:
     """
@@ -50,9 +53,9 @@ class APIFootballClient:
         cache_key = f"team_search:{team_name.lower()}"
 
         # Check cache first
-        cached_result = await team_cache.get(cache_key)
+        cached_result = team_cache.get(cache_key)
         if cached_result is not None:
-            print(f"✅ Cache hit for team: {team_name}")
+            logger.debug("✅ Cache hit for team: %s", team_name)
             return cached_result
 
         try:
@@ -108,9 +111,9 @@ class APIFootballClient:
         cache_key = f"squad:{team_id}"
 
         # Check cache first
-        cached_result = await squad_cache.get(cache_key)
+        cached_result = squad_cache.get(cache_key)
         if cached_result is not None:
-            print(f"✅ Cache hit for squad: {team_id}")
+            logger.debug("✅ Cache hit for squad: %s", team_id)
             return cached_result
 
         try:
@@ -58,14 +58,14 @@ class FootballAPIClient:
         cache_key = f"football_data_team:{team_name.lower()}"
 
         # Check cache first
-        cached_team = await team_cache.get(cache_key)
+        cached_team = team_cache.get(cache_key)
         if cached_team is not None:
             return cached_team
 
         try:
             # Try to get teams list from cache
             teams_cache_key = "football_data_teams_list"
-            teams = await api_cache.get(teams_cache_key)
+            teams = api_cache.get(teams_cache_key)
 
             if not teams:
                 async with httpx.AsyncClient() as client:
@@ -20,8 +20,11 @@ from datetime import datetime
 import httpx
 
 from src.core.cache import api_cache, squad_cache, team_cache
+from src.core.logger import get_logger
 from src.domain.entities import Team
 
+logger = get_logger(__name__)
+
 
 class TheSportsDBClient:
     """
@@ -61,16 +64,18 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_team_search:{team_name.lower()}"
 
         # Check cache first
-        cached_result = await team_cache.get(cache_key)
+        cached_result = team_cache.get(cache_key)
         if cached_result is not None:
             cached_name = cached_result.get("strTeam", "").lower()
             # Validar que el cache coincide con la búsqueda
             if team_name.lower() in cached_name or cached_name in team_name.lower():
-                print(f"✅ Cache hit for team: {team_name}")
+                logger.debug("✅ Cache hit for team: %s", team_name)
                 return cached_result
             else:
-                print(
-                    f"⚠️ Cache mismatch for search '{team_name}': got '{cached_name}', deleting corrupted cache"
+                logger.warning(
+                    "⚠️ Cache mismatch for search '%s': got '%s', deleting corrupted cache",
+                    team_name,
+                    cached_name,
                 )
                 await team_cache.delete(cache_key)
 
@@ -122,14 +127,16 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_team:{team_id}"
 
         # Check cache first
-        cached_result = await team_cache.get(cache_key)
+        cached_result = team_cache.get(cache_key)
         if cached_result is not None:
             # Validar que el cache tiene el ID correcto
             if str(cached_result.get("idTeam")) == str(team_id):
                 return cached_result
             else:
-                print(
-                    f"⚠️ Cache mismatch for team {team_id}: got {cached_result.get('idTeam')}, deleting corrupted cache"
+                logger.warning(
+                    "⚠️ Cache mismatch for team %s: got %s, deleting corrupted cache",
+                    team_id,
+                    cached_result.get("idTeam"),
                 )
                 await team_cache.delete(cache_key)
 
@@ -181,9 +188,9 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_squad:{team_id}"
 
         # Check cache first
-        cached_result = await squad_cache.get(cache_key)
+        cached_result = squad_cache.get(cache_key)
         if cached_result is not None:
-            print(f"✅ Cache hit for squad: {team_id}")
+            logger.debug("✅ Cache hit for squad: %s", team_id)
             return cached_result
 
         try:
@@ -301,7 +308,7 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_fixtures:{team_id}:next"
 
         # Check cache first
-        cached_result = await api_cache.get(cache_key)
+        cached_result = api_cache.get(cache_key)
         if cached_result is not None:
             return cached_result[:limit] if cached_result else []
 
@@ -332,7 +339,7 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_fixtures:{team_id}:last"
 
         # Check cache first
-        cached_result = await api_cache.get(cache_key)
+        cached_result = api_cache.get(cache_key)
         if cached_result is not None:
             return cached_result[:limit] if cached_result else []
 
@@ -408,7 +415,7 @@ class TheSportsDBClient:
         cache_key = f"thesportsdb_player_search:{player_name.lower()}"
 
         # Check cache first
-        cached_result = await api_cache.get(cache_key)
+        cached_result = api_cache.get(cache_key)
         if cached_result is not None:
             return cached_result[:limit] if cached_result else []
 
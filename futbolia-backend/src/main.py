@@ -42,8 +42,8 @@ async def lifespan(app: FastAPI):
 
     # Initialize ChromaDB and seed data
     PlayerVectorStore.initialize()
-    seed_players()
-    log_info("ChromaDB initialized", players=PlayerVectorStore.count())
+    player_count = seed_players()
+    log_info("ChromaDB initialized", players=player_count)
 
     # Initialize Dixie AI
     DixieAI.initialize()
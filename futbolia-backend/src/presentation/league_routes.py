@@ -379,7 +379,7 @@ async def get_standings(
 
     # Check cache first (5 minutes TTL)
     cache_key = f"standings:{league}"
-    cached = await api_cache.get(cache_key)
+    cached = api_cache.get(cache_key)
     if cached:
         log_info("Standings from cache", league=league)
         return {"standings": cached, "league": league, "cached": True}
@@ -324,7 +324,7 @@ async def get_teams_with_players(
     cache_key = f"teams_with_players_list_{'all' if include_all else 'premier'}"
 
     # Check cache first (5 minute cache)
-    cached_teams = await api_cache.get(cache_key)
+    cached_teams = api_cache.get(cache_key)
     if cached_teams is not None:
         return {"success": True, "data": {"teams": cached_teams, "total": len(cached_teams)}}
 
@@ -64,8 +64,7 @@ class PredictionUseCase:
         home_team.form, away_team.form = await asyncio.gather(home_form_task, away_form_task)
 
         # Step 2: Get player attributes from ChromaDB (RAG context)
-        # These are synchronous calls in the current implementation, but we can still call them sequentially
-        # as they are usually fast (local vector DB)
+        # Team lookups are served from the store's in-memory index, so call them directly
         home_players = PlayerVectorStore.search_by_team(home_team.name, limit=15)
         away_players = PlayerVectorStore.search_by_team(away_team.name, limit=15)
 
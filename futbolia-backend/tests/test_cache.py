@@ -0,0 +1,48 @@
+"""
+GoalMind Backend - Cache Tests
+Tests for the TTL cache and the @cached decorator
+"""
+
+import pytest
+
+from src.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for TTLCache"""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self):
+        """Stored values should be returned until they expire"""
+        cache = TTLCache(max_size=10, default_ttl=60)
+        await cache.set("team:1", {"name": "Barcelona"})
+        assert cache.get("team:1") == {"name": "Barcelona"}
+        assert cache.get("team:2") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        """Entries with an elapsed TTL should not be returned"""
+        cache = TTLCache(max_size=10, default_ttl=60)
+        await cache.set("team:1", "value", ttl=0)
+        assert cache.get("team:1") is None
+
+    @pytest.mark.asyncio
+    async def test_eviction_keeps_recently_used(self):
+        """When full, the least recently used entry should be evicted"""
+        cache = TTLCache(max_size=3, default_ttl=60)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+        cache.get("a")
+        await cache.set("d", "d")
+        assert cache.get("a") == "a"
+        assert cache.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_overwrite_does_not_evict(self):
+        """Overwriting an existing key should not evict other entries"""
+        cache = TTLCache(max_size=2, default_ttl=60)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.set("a", 3)
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
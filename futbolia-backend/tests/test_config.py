@@ -61,6 +61,23 @@ class TestSettings:
             assert "https://example.com" in settings.CORS_ORIGINS
             assert "https://api.example.com" in settings.CORS_ORIGINS
 
+    def test_settings_are_frozen(self):
+        """Settings should be immutable and precompute IS_PRODUCTION"""
+        from dataclasses import FrozenInstanceError
+
+        from src.core.config import Settings
+
+        settings = Settings(ENVIRONMENT="production", JWT_SECRET_KEY="secret")
+        assert settings.IS_PRODUCTION is True
+        with pytest.raises(FrozenInstanceError):
+            settings.PORT = 9000
+
+    def test_get_settings_is_cached(self):
+        """get_settings should return the same instance until the cache is cleared"""
+        from src.core.config import get_settings
+
+        assert get_settings() is get_settings()
+
     def test_validate_warns_missing_api_key(self):
         """Validate should warn about missing DEEPSEEK_API_KEY"""
         from src.core.config import Settings
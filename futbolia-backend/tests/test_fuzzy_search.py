@@ -0,0 +1,73 @@
+"""
+GoalMind Backend - Fuzzy Search Tests
+Tests for team name matching, suggestions and autocomplete
+"""
+
+KNOWN_TEAMS = [
+    "Real Madrid",
+    "Barcelona",
+    "Barcelona SC",
+    "Manchester City",
+    "Manchester United",
+    "Liverpool",
+    "Emelec",
+]
+
+
+class TestFuzzySearch:
+    """Test suite for fuzzy team search helpers"""
+
+    def test_normalize_text(self):
+        """Text should be lowercased, stripped of punctuation and collapsed"""
+        from src.core.fuzzy_search import normalize_text
+
+        assert normalize_text("  Real   Madrid!! ") == "real madrid"
+
+    def test_find_by_alias(self):
+        """Known aliases should resolve to the canonical team"""
+        from src.core.fuzzy_search import find_by_alias
+
+        assert find_by_alias("barca") == "Barcelona"
+        assert find_by_alias("xyz") is None
+
+    def test_fuzzy_search_typo(self):
+        """A misspelled team should rank the intended team first"""
+        from src.core.fuzzy_search import fuzzy_search_teams
+
+        results = fuzzy_search_teams("brcelona", KNOWN_TEAMS)
+        assert results[0][0] == "Barcelona"
+        assert all(score >= 0.6 for _, score in results)
+
+    def test_fuzzy_search_batch_matches_single(self):
+        """Batch ranking should agree with one-query-at-a-time search"""
+        from src.core.fuzzy_search import fuzzy_search_teams, fuzzy_search_teams_batch
+
+        queries = ["brcelona", "man city", "liverpol", "emelek", "madrid", "united", ""]
+        batch = fuzzy_search_teams_batch(queries, KNOWN_TEAMS)
+        assert batch == [fuzzy_search_teams(query, KNOWN_TEAMS) for query in queries]
+
+    def test_suggest_corrections(self):
+        """Suggestions should include metadata for known teams"""
+        from src.core.fuzzy_search import suggest_corrections
+
+        result = suggest_corrections("Liverpol", KNOWN_TEAMS)
+        assert result["best_match"] == "Liverpool"
+        assert result["suggestions"][0]["country"] == "Inglaterra"
+
+    def test_auto_complete(self):
+        """Prefix matches should come before word and alias matches"""
+        from src.core.fuzzy_search import auto_complete
+
+        results = auto_complete("man", KNOWN_TEAMS, limit=5)
+        assert results[:2] == ["Manchester City", "Manchester United"]
+        assert len(results) <= 5
+
+    def test_suggest_corrections_returns_fresh_results(self):
+        """Cached suggestions must not leak mutations between calls"""
+        from src.core.fuzzy_search import suggest_corrections
+
+        first = suggest_corrections("Liverpol", KNOWN_TEAMS)
+        first["suggestions"][0]["name"] = "Mutated"
+        second = suggest_corrections("Liverpol", KNOWN_TEAMS)
+        assert second["best_match"] == "Liverpool"
+        assert second["suggestions"][0]["name"] == "Liverpool"
@@ -0,0 +1,77 @@
+"""
+GoalMind Backend - Player Store Tests
+Tests for the ChromaDB player store write path and team index
+"""
+
+import chromadb
+import pytest
+from chromadb.config import Settings as ChromaSettings
+
+from src.domain.entities import PlayerAttributes
+from src.infrastructure.chromadb.player_store import PlayerVectorStore
+
+
+class FakeEmbedding(chromadb.EmbeddingFunction):
+    """Deterministic embedding so tests do not download a model"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    def __call__(self, input):
+        if self.fail:
+            raise RuntimeError("embedding unavailable")
+        return [[float(len(text)), 1.0, 0.5] for text in input]
+
+    @staticmethod
+    def name():
+        return "fake"
+
+    def get_config(self):
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return FakeEmbedding()
+
+
+def _open_store(monkeypatch, path, fail: bool = False) -> None:
+    """Point the store at a fresh collection under path"""
+    client = chromadb.PersistentClient(
+        path=str(path), settings=ChromaSettings(anonymized_telemetry=False)
+    )
+    collection = client.get_or_create_collection(
+        "players", embedding_function=FakeEmbedding(fail=fail)
+    )
+    monkeypatch.setattr(PlayerVectorStore, "_client", client)
+    monkeypatch.setattr(PlayerVectorStore, "_collection", collection)
+    monkeypatch.setattr(PlayerVectorStore, "_team_index", {})
+    monkeypatch.setattr(PlayerVectorStore, "_indexed_ids", {})
+    PlayerVectorStore._rebuild_team_index()
+
+
+class TestPlayerVectorStore:
+    """Test suite for PlayerVectorStore"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_star_cache(self):
+        yield
+        PlayerVectorStore._cached_star_players.cache_clear()
+
+    def test_added_players_are_indexed(self, monkeypatch, tmp_path):
+        """Stored players should be served by team and counted"""
+        _open_store(monkeypatch, tmp_path)
+        PlayerVectorStore.add_players_batch(
+            [PlayerAttributes(player_id=f"p{i}", name=f"P{i}", team="A") for i in range(3)]
+        )
+
+        assert [p.name for p in PlayerVectorStore.search_by_team("A")] == ["P0", "P1", "P2"]
+        assert PlayerVectorStore.count() == 3
+
+    def test_failed_write_is_not_indexed(self, monkeypatch, tmp_path):
+        """A failed write should raise to the caller and leave the team index untouched"""
+        _open_store(monkeypatch, tmp_path, fail=True)
+
+        with pytest.raises(RuntimeError):
+            PlayerVectorStore.add_player(PlayerAttributes(player_id="p1", name="P1", team="A"))
+        assert PlayerVectorStore.search_by_team("A") == []
+        assert PlayerVectorStore.get_all_teams() == []
@@ -0,0 +1,109 @@
+"""
+GoalMind Backend - Rate Limit Tests
+Tests for the in-memory sliding window limiter
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.rate_limit import RateLimiter, RateLimitMiddleware
+
+
+def _make_limiter(window_seconds: int = 60) -> RateLimitMiddleware:
+    return RateLimitMiddleware(app=None, default_limit=60, window_seconds=window_seconds)
+
+
+class TestRateLimitMiddleware:
+    """Test suite for RateLimitMiddleware bookkeeping"""
+
+    def test_limit_is_enforced(self):
+        """Requests beyond the limit inside one window should be rejected"""
+        limiter = _make_limiter()
+        with patch("src.core.rate_limit.time.monotonic", return_value=1000.0):
+            results = [limiter._is_rate_limited("ip:1", 3)[0] for _ in range(4)]
+        assert results == [False, False, False, True]
+
+    def test_old_requests_expire(self):
+        """Requests older than the window should no longer count"""
+        limiter = _make_limiter(window_seconds=60)
+        with patch("src.core.rate_limit.time.monotonic", return_value=1000.0):
+            limiter._is_rate_limited("ip:1", 1)
+        with patch("src.core.rate_limit.time.monotonic", return_value=1061.0):
+            is_limited, count, _ = limiter._is_rate_limited("ip:1", 1)
+        assert not is_limited
+        assert count == 1
+
+    def test_endpoint_limits(self):
+        """Endpoint limits should apply to exact paths and their sub-paths"""
+        limiter = _make_limiter()
+        assert limiter._get_limit("/api/v1/auth/login") == 30
+        assert limiter._get_limit("/api/v1/predictions/predict/extra") == 50
+        assert limiter._get_limit("/api/v1/teams") == 60
+
+    def test_tracked_identifiers_are_bounded(self):
+        """The least recently seen identifier should be dropped at capacity"""
+        limiter = _make_limiter()
+        limiter.MAX_TRACKED_IDENTIFIERS = 2
+        with patch("src.core.rate_limit.time.monotonic", return_value=1000.0):
+            for identifier in ("ip:1", "ip:2", "ip:1", "ip:3"):
+                limiter._is_rate_limited(identifier, 10)
+        assert list(limiter.requests) == ["ip:1", "ip:3"]
+
+    def test_idle_identifiers_are_swept(self):
+        """Identifiers with no requests in the window should be forgotten"""
+        limiter = _make_limiter(window_seconds=60)
+        with patch("src.core.rate_limit.time.monotonic", return_value=1000.0):
+            limiter._is_rate_limited("ip:1", 10)
+        with patch("src.core.rate_limit.time.monotonic", return_value=1100.0):
+            limiter._is_rate_limited("ip:2", 10)
+        assert list(limiter.requests) == ["ip:2"]
+
+    def test_identifier_prefers_user_from_state(self):
+        """Authenticated requests should be keyed by user, others by client IP"""
+        from starlette.requests import Request
+
+        limiter = _make_limiter()
+        scope = {"type": "http", "headers": [], "client": ("10.0.0.1", 1234)}
+        request = Request(scope)
+        assert limiter._get_identifier(request) == "ip:10.0.0.1"
+        request.state.user_id = "abc"
+        assert limiter._get_identifier(request) == "user:abc"
+
+    def test_limit_warnings_are_throttled(self):
+        """Repeated rejections should log once per interval with a suppressed count"""
+        limiter = _make_limiter()
+        with (
+            patch("src.core.rate_limit.log_warning") as warn,
+            patch("src.core.rate_limit.time.monotonic", return_value=1000.0),
+        ):
+            for _ in range(3):
+                limiter._log_limit_exceeded("ip:1", "/api", 1, 1)
+        assert warn.call_count == 1
+
+        with (
+            patch("src.core.rate_limit.log_warning") as warn,
+            patch("src.core.rate_limit.time.monotonic", return_value=1002.0),
+        ):
+            limiter._log_limit_exceeded("ip:1", "/api", 1, 1)
+        assert warn.call_args.kwargs["suppressed"] == 2
+
+
+class TestRateLimiter:
+    """Test suite for the RateLimiter decorator"""
+
+    @pytest.mark.asyncio
+    async def test_decorated_function_is_limited(self):
+        """Calls beyond the limit should raise a 429"""
+
+        @RateLimiter(limit=2, window=60)
+        async def expensive() -> str:
+            return "ok"
+
+        assert await expensive() == "ok"
+        assert await expensive() == "ok"
+        with pytest.raises(HTTPException) as exc_info:
+            await expensive()
+        assert exc_info.value.status_code == 429
+        assert expensive.__name__ == "expensive"
@@ -0,0 +1,58 @@
+"""
+GoalMind Backend - Seed Data Tests
+Tests for the bundled sample player data
+"""
+
+import pytest
+
+from src.infrastructure.chromadb import seed_data
+
+
+class TestSampleData:
+    """Test suite for the sample player CSV loader"""
+
+    def test_sample_players_are_unique(self):
+        """Bundled players should have unique ids and rating vectors"""
+        from dataclasses import astuple
+
+        players = seed_data.load_sample_players()
+        assert len(players) > 0
+        assert len({p.player_id for p in players}) == len(players)
+        assert len({astuple(p)[4:] for p in players}) == len(players)
+
+    def test_duplicate_ids_are_dropped(self, tmp_path, monkeypatch):
+        """A repeated player id should keep only the first row"""
+        csv_file = tmp_path / "players.csv"
+        csv_file.write_text(
+            "player_id,name,team,position,overall_rating,pace,shooting,"
+            "passing,dribbling,defending,physical\n"
+            "x_1,First,Team,ST,80,70,70,70,70,70,70\n"
+            "x_1,Second,Team,ST,81,71,71,71,71,71,71\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(seed_data, "SAMPLE_PLAYERS_CSV", csv_file)
+        seed_data.load_sample_players.cache_clear()
+        try:
+            players = seed_data.load_sample_players()
+        finally:
+            seed_data.load_sample_players.cache_clear()
+
+        assert [p.name for p in players] == ["First"]
+        assert players[0].overall_rating == 80
+
+    def test_reordered_columns_are_rejected(self, tmp_path, monkeypatch):
+        """A header that does not match the PlayerAttributes fields should fail loudly"""
+        csv_file = tmp_path / "players.csv"
+        csv_file.write_text(
+            "player_id,name,team,position,pace,overall_rating,shooting,"
+            "passing,dribbling,defending,physical\n"
+            "x_1,First,Team,ST,70,80,70,70,70,70,70\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(seed_data, "SAMPLE_PLAYERS_CSV", csv_file)
+        seed_data.load_sample_players.cache_clear()
+        try:
+            with pytest.raises(ValueError):
+                seed_data.load_sample_players()
+        finally:
+            seed_data.load_sample_players.cache_clear()